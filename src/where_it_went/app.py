@@ -8,6 +8,7 @@ from where_it_went.dynamodb_setup import DynamoDBSetup
 from where_it_went.service.open_ai import OpenAIService
 from where_it_went.service.report_service import ReportService
 from where_it_went.socket_setup import SocketSetup
+from where_it_went.utils import fast_json
 
 app = Flask(__name__)
 
@@ -37,5 +38,7 @@ socketio = SocketIO(
   cors_allowed_origins="*",
   ping_timeout=120,  # 2 minutes for large radius searches
   ping_interval=25,  # Send ping every 25 seconds
+  # pydantic-core encodes the places payloads much faster than stdlib json
+  json=fast_json,
 )
 socketio.on_namespace(SocketSetup("/dev", redis_client, dynamodb_setup))
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from http import HTTPMethod, HTTPStatus
 from typing import Any
 
@@ -58,7 +59,7 @@ def add() -> tuple[flask.Response, HTTPStatus]:
 @bp.route(rule="/search-spending-by-award", methods=[HTTPMethod.GET])
 def search_spending_by_award() -> tuple[flask.Response, HTTPStatus]:
   """Search for federal spending by award using USA Spending API."""
-  args_result: Result[dict[str, str], str] = parse_get_json(request)
+  args_result: Result[Mapping[str, str], str] = parse_get_json(request)
   match args_result:
     case Err(error):
       return jsonify({"error": error}), HTTPStatus.BAD_REQUEST
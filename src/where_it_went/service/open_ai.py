@@ -1,4 +1,5 @@
 import json
+import re
 from http import HTTPStatus
 
 import openai
@@ -8,6 +9,8 @@ from where_it_went.service.usa_spending import SpendingResponse
 from where_it_went.utils import pipe, result
 from where_it_went.utils.result import Ok, Result
 
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+
 
 class OpenAIService:
   openai_client: openai.OpenAI
@@ -129,9 +132,8 @@ class OpenAIService:
       print(f"[OpenAIService] Got output_text: {raw_output[:100]}...")
       # Clean up excessive whitespace
       if raw_output:
-        import re
-
-        cleaned_output = re.sub(r"\n{3,}", "\n\n", raw_output)  # Max 2 newlines
+        # Max 2 newlines
+        cleaned_output = _EXCESS_NEWLINES.sub("\n\n", raw_output)
         return Ok(cleaned_output.strip())
       return Ok(None)
     except Exception as e:
@@ -3,6 +3,7 @@ from typing import Any
 
 import requests
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
 
 from where_it_went import config
 from where_it_went.utils import pipe, result
@@ -62,7 +63,12 @@ EXCLUDED_PLACE_TYPES = [
   "hindu_temple",
 ]
 
+# Sessions are shared module wide so connections to the Places API are kept
+# alive between requests, the pool is sized for the parallel cell fetches
 places_session = requests.Session()
+places_session.mount(
+  "https://", HTTPAdapter(pool_connections=4, pool_maxsize=32)
+)
 places_session.headers.update(
   {
     "Content-Type": "application/json",
@@ -79,6 +85,13 @@ places_session.headers.update(
   }
 )
 
+autocomplete_session = requests.Session()
+autocomplete_session.headers.update(
+  {
+    "Content-Type": "application/json",
+  }
+)
+
 
 class SearchNearbyRequest(BaseModel):
   latitude: float
@@ -246,25 +259,8 @@ def send_text_search_request(
     result.unwrap(),
   )
 
-  # Text Search requires specific field mask
-  text_search_session = requests.Session()
-  text_search_session.headers.update(
-    {
-      "Content-Type": "application/json",
-      "X-Goog-FieldMask": str.join(
-        ",",
-        [
-          "places.displayName",
-          "places.location",
-          "places.types",
-          "places.formattedAddress",
-          "places.addressComponents",
-        ],
-      ),
-    }
-  )
-
-  text_search_response = text_search_session.post(
+  # Text Search uses the same field mask as nearby search
+  text_search_response = places_session.post(
     API_URL + TEXT_SEARCH_ENDPOINT,
     json=api_request_model.model_dump(by_alias=True),
     headers={"X-Goog-Api-Key": places_api_key},
@@ -357,14 +353,6 @@ def send_autocomplete_request(
     result.unwrap(),
   )
 
-  # Autocomplete session
-  autocomplete_session = requests.Session()
-  autocomplete_session.headers.update(
-    {
-      "Content-Type": "application/json",
-    }
-  )
-
   autocomplete_response = autocomplete_session.post(
     API_URL + AUTOCOMPLETE_ENDPOINT,
     json=api_request_model.model_dump(by_alias=True),
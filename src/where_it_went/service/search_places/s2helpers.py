@@ -1,10 +1,14 @@
+import functools
 import math
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 
 import s2cell  # pyright: ignore[reportMissingTypeStubs]
 
 from where_it_went.utils import listutils, pipe
 
+EARTH_RADIUS_IN_METERS = 6371000.0
+
 MAX_S2_LEVEL = 24
 MIN_S2_LEVEL = 5
 
@@ -48,6 +52,14 @@ def radius_to_level(radius: float) -> int:
   return left_index
 
 
+@dataclass(frozen=True)
+class CellBounds:
+  latitude_min: float
+  longitude_min: float
+  latitude_max: float
+  longitude_max: float
+
+
 @dataclass(frozen=True)
 class SearchRegion:
   """
@@ -58,28 +70,67 @@ class SearchRegion:
   longitude: float
   radius: float
 
+  @functools.cached_property
+  def bounds(self) -> CellBounds:
+    """
+    Smallest lat/lon box containing the whole region, cheap to test cells
+    against before measuring any actual distances
+    """
+    angular_radius = self.radius / EARTH_RADIUS_IN_METERS
+    delta_latitude = math.degrees(angular_radius)
+
+    cos_latitude = math.cos(math.radians(self.latitude))
+    if math.sin(angular_radius) >= cos_latitude:
+      # region reaches over a pole, so it spans every longitude
+      longitude_min, longitude_max = -180.0, 180.0
+    else:
+      delta_longitude = math.degrees(
+        math.asin(math.sin(angular_radius) / cos_latitude)
+      )
+      longitude_min = self.longitude - delta_longitude
+      longitude_max = self.longitude + delta_longitude
+
+    return CellBounds(
+      latitude_min=self.latitude - delta_latitude,
+      longitude_min=longitude_min,
+      latitude_max=self.latitude + delta_latitude,
+      longitude_max=longitude_max,
+    )
+
 
 @dataclass(frozen=True)
 class Cell:
   """
   Wrapper type for S2Cell
+
+  `point` is where searches for the cell are centered, when left out it's
+  the center of the cell, which is only computed once it's actually read
   """
 
   id: int
   token: str
   level: int
-  latitude: float
-  longitude: float
+  point: tuple[float, float] | None = None
+
+  @functools.cached_property
+  def _resolved_point(self) -> tuple[float, float]:
+    match self.point:
+      case None:
+        return s2cell.cell_id_to_lat_lon(self.id)
+      case point:
+        return point
+
+  @property
+  def latitude(self) -> float:
+    return self._resolved_point[0]
+
+  @property
+  def longitude(self) -> float:
+    return self._resolved_point[1]
 
 
 def clamp[a: float | int](value: a, minimum: a, maximum: a) -> a:
-  match value:
-    case value if value < minimum:
-      return minimum
-    case value if value > maximum:
-      return maximum
-    case value:
-      return value
+  return min(maximum, max(minimum, value))
 
 
 def new_search_region(
@@ -92,25 +143,23 @@ def new_search_region(
   )
 
 
-def search_region_to_cell(region: SearchRegion) -> Cell:
-  level = radius_to_level(region.radius)
-  id = s2cell.lat_lon_to_cell_id(region.latitude, region.longitude, level=level)
-  token = s2cell.cell_id_to_token(id)
-  return Cell(
-    id=id,
-    token=token,
-    level=level,
-    latitude=region.latitude,
-    longitude=region.longitude,
-  )
+@functools.lru_cache(maxsize=4096)
+def _cell_id_and_token(
+  latitude: float, longitude: float, level: int
+) -> tuple[int, str]:
+  id = s2cell.lat_lon_to_cell_id(latitude, longitude, level=level)
+  return id, s2cell.cell_id_to_token(id)
 
 
-@dataclass(frozen=True)
-class CellBounds:
-  latitude_min: float
-  longitude_min: float
-  latitude_max: float
-  longitude_max: float
+def search_region_to_cell(region: SearchRegion) -> Cell:
+  level = radius_to_level(region.radius)
+  # Rounding to 5 decimal places (~1.1m) so that repeated location updates
+  # from a device that hasn't really moved are served from the cache.
+  # The cell's point is the rounded one too, otherwise a region right on a
+  # cell edge could end up with a point outside of its own cell
+  latitude, longitude = round(region.latitude, 5), round(region.longitude, 5)
+  id, token = _cell_id_and_token(latitude, longitude, level)
+  return Cell(id=id, token=token, level=level, point=(latitude, longitude))
 
 
 def get_bounds(cell: Cell) -> CellBounds:
@@ -140,27 +189,21 @@ def get_parent(cell: Cell) -> Cell:
   parent_id = s2cell.cell_id_to_parent_cell_id(cell.id)
   parent_token = s2cell.cell_id_to_token(parent_id)
   parent_level = s2cell.cell_id_to_level(parent_id)
-  parent_latitude, parent_longitude = s2cell.cell_id_to_lat_lon(parent_id)
-  return Cell(
-    parent_id, parent_token, parent_level, parent_latitude, parent_longitude
-  )
+  parent_point = s2cell.cell_id_to_lat_lon(parent_id)
+  return Cell(parent_id, parent_token, parent_level, parent_point)
 
 
-def get_children(cell: Cell) -> list[Cell]:
-  children: list[Cell] = []
+def get_children(cell: Cell) -> Iterator[Cell]:
+  """
+  Yields the four children of the cell
 
+  Their centers are left to be computed lazily since most children
+  are only ever looked up by token
+  """
   new_lobm = _lowest_one_bit_mask(cell.id) >> 2
   for position in range(4):
     id = cell.id + (2 * position + 1 - 4) * new_lobm
-    token = s2cell.cell_id_to_token(id)
-    latitude, longitude = s2cell.cell_id_to_lat_lon(id)
-    level = s2cell.cell_id_to_level(id)
-
-    child = Cell(
-      id=id, token=token, level=level, latitude=latitude, longitude=longitude
-    )
-    children.append(child)
-  return children
+    yield Cell(id=id, token=s2cell.cell_id_to_token(id), level=cell.level + 1)
 
 
 def get_neighbors(cell: Cell) -> list[Cell]:
@@ -170,25 +213,46 @@ def get_neighbors(cell: Cell) -> list[Cell]:
     cell.id, edge=True, corner=True
   ):
     token = s2cell.cell_id_to_token(neighbor_id)
-    latitude, longitude = s2cell.cell_id_to_lat_lon(neighbor_id)
+    point = s2cell.cell_id_to_lat_lon(neighbor_id)
     level = s2cell.cell_id_to_level(neighbor_id)
 
-    neighbor = Cell(
-      id=neighbor_id,
-      token=token,
-      level=level,
-      latitude=latitude,
-      longitude=longitude,
-    )
+    neighbor = Cell(id=neighbor_id, token=token, level=level, point=point)
     neighbors.append(neighbor)
   return neighbors
 
 
+def haversine_from(
+  latitude1: float, longitude1: float
+) -> Callable[[float, float], float]:
+  """
+  Return a function that gives the distance in meters from the given
+  lat/lon point, so the trig for that point is only computed once
+  """
+  phi1 = math.radians(latitude1)
+  cos_phi1 = math.cos(phi1)
+
+  def distance_to(latitude2: float, longitude2: float) -> float:
+    phi2 = math.radians(latitude2)
+    delta_latitude = phi2 - phi1
+    delta_longitude = math.radians(longitude2 - longitude1)
+    haversine_of_central_angle = (
+      math.sin(delta_latitude / 2) ** 2
+      + cos_phi1 * math.cos(phi2) * math.sin(delta_longitude / 2) ** 2
+    )
+    return (
+      # converting angular distance to linear distance
+      EARTH_RADIUS_IN_METERS
+      * 2
+      * math.asin(math.sqrt(haversine_of_central_angle))
+    )
+
+  return distance_to
+
+
 def haversine_distance(
   latitude1: float, longitude1: float, latitude2: float, longitude2: float
 ) -> float:
   """Return distance in meters between two lat/lon points"""
-  earth_radius_in_meters = 6371000.0
   phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
   delta_latitude = phi2 - phi1
   delta_longitude = math.radians(longitude2 - longitude1)
@@ -198,36 +262,85 @@ def haversine_distance(
   )
   return (
     # converting angular distance to linear distance
-    earth_radius_in_meters
+    EARTH_RADIUS_IN_METERS
     * 2
     * math.asin(math.sqrt(haversine_of_central_angle))
   )
 
 
-def search_region_intersects_cell(region: SearchRegion, cell: Cell) -> bool:
+def search_region_intersects_cell(
+  region: SearchRegion,
+  cell: Cell,
+  distance_from_region: Callable[[float, float], float] | None = None,
+) -> bool:
+  """
+  `distance_from_region` is the region center's `haversine_from`, callers
+  checking many cells against one region can build it once and pass it in
+  """
   bounds = get_bounds(cell)
+  region_bounds = region.bounds
 
-  closest_latitude = clamp(
-    region.latitude, bounds.latitude_min, bounds.latitude_max
+  # Most neighbors can be ruled out by comparing boxes alone,
+  # only fall back to the haversine when the boxes overlap
+  if (
+    bounds.latitude_min > region_bounds.latitude_max
+    or bounds.latitude_max < region_bounds.latitude_min
+  ):
+    return False
+  # Longitudes are only comparable as plain numbers when nothing
+  # wraps around the antimeridian
+  if (
+    -180.0 <= region_bounds.longitude_min
+    and region_bounds.longitude_max <= 180.0
+    and -180.0 <= bounds.longitude_min
+    and bounds.longitude_max <= 180.0
+    and (
+      bounds.longitude_min > region_bounds.longitude_max
+      or bounds.longitude_max < region_bounds.longitude_min
+    )
+  ):
+    return False
+
+  # clamping inline since this runs for every neighbor of every search
+  closest_latitude = (
+    bounds.latitude_min
+    if region.latitude < bounds.latitude_min
+    else bounds.latitude_max
+    if region.latitude > bounds.latitude_max
+    else region.latitude
   )
-  closest_longitude = clamp(
-    region.longitude, bounds.longitude_min, bounds.longitude_max
+  # Measuring the region's longitude from the same side of the antimeridian
+  # as the cell, so a cell just across ±180° gets clamped to its near edge
+  region_longitude = region.longitude
+  if region_longitude - cell.longitude > 180.0:
+    region_longitude -= 360.0
+  elif region_longitude - cell.longitude < -180.0:
+    region_longitude += 360.0
+  closest_longitude = (
+    bounds.longitude_min
+    if region_longitude < bounds.longitude_min
+    else bounds.longitude_max
+    if region_longitude > bounds.longitude_max
+    else region_longitude
   )
 
-  distance = haversine_distance(
-    region.latitude, region.longitude, closest_latitude, closest_longitude
-  )
+  if distance_from_region is None:
+    distance_from_region = haversine_from(region.latitude, region.longitude)
+  distance = distance_from_region(closest_latitude, closest_longitude)
   return distance <= region.radius
 
 
 def get_intersecting_cells(
   region: SearchRegion, center_cell: Cell
 ) -> list[Cell]:
+  distance_from_region = haversine_from(region.latitude, region.longitude)
   intersecting_neighbors = pipe(
     center_cell,
     get_neighbors,
     listutils.filter(
-      lambda neighbor: search_region_intersects_cell(region, neighbor)
+      lambda neighbor: search_region_intersects_cell(
+        region, neighbor, distance_from_region
+      )
     ),
   )
 
@@ -1,7 +1,10 @@
+import logging
+import math
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+import eventlet  # pyright: ignore[reportMissingTypeStubs]
 from pydantic import BaseModel, TypeAdapter, ValidationError
 from redis import Redis
 from redis.lock import Lock
@@ -11,6 +14,8 @@ from where_it_went.service.search_places import api, s2helpers
 from where_it_went.utils import listutils, pipe, result
 from where_it_went.utils.result import Err, Ok, Result
 
+logger = logging.getLogger(__name__)
+
 
 class Place(BaseModel):
   name: str
@@ -107,8 +112,10 @@ def serialize_places(places: list[Place]) -> bytes:
 
 
 def deserialize_places(b: bytes) -> Result[list[Place], str]:
+  # Cached bytes are only ever written by `serialize_places`,
+  # so strict mode is safe and skips pydantic's type coercion paths
   try:
-    return Ok(PLACES_ADAPTER.validate_json(b, by_alias=True))
+    return Ok(PLACES_ADAPTER.validate_json(b, strict=True))
   except ValidationError as e:
     return Err(str(e))
 
@@ -127,7 +134,11 @@ def load_places_from_cache(
 
 def load_places_from_dynamodb(
   dynamodb_client: DynamoDBSetup, cell: s2helpers.Cell
-) -> Result[list[Place], DynamoDBError]:
+) -> Result[tuple[list[Place], bytes], DynamoDBError]:
+  """
+  Also returns the stored payload so callers can backfill the cache
+  with it as is instead of serializing the places again
+  """
   try:
     db_entry = dynamodb_client.dynamodb_client.get_item(
       TableName="NearbyPlaces",
@@ -145,10 +156,12 @@ def load_places_from_dynamodb(
     if not places_json_str:
       return Err(DynamoDBMiss())
 
-    # Deserialize
-    return result.replace_error(
-      CorruptedValue(), deserialize_places(places_json_str.encode())
-    )
+    serialized_places = places_json_str.encode()
+    match deserialize_places(serialized_places):
+      case Ok(places):
+        return Ok((places, serialized_places))
+      case Err(_):
+        return Err(CorruptedValue())
   except dynamodb_client.dynamodb_client.exceptions.ResourceNotFoundException:
     return Err(DynamoDBMiss())
   except dynamodb_client.dynamodb_client.exceptions.ClientError:
@@ -156,33 +169,43 @@ def load_places_from_dynamodb(
 
 
 def save_places_to_dynamodb(
-  dynamodb_client: DynamoDBSetup, cell: s2helpers.Cell, places: list[Place]
+  dynamodb_client: DynamoDBSetup, cell: s2helpers.Cell, serialized_places: bytes
 ) -> None:
+  item: dict[str, Any] = {
+    "id": {"S": cell.token},
+    "places": {"S": serialized_places.decode()},
+  }
   try:
     _ = dynamodb_client.dynamodb_client.put_item(
-      TableName="NearbyPlaces",
-      Item={
-        "id": {"S": cell.token},
-        "places": {"S": serialize_places(places).decode()},
-      },
+      TableName="NearbyPlaces", Item=item
     )
   except dynamodb_client.dynamodb_client.exceptions.ResourceNotFoundException:
     # If the table doesn't exist, create it and retry
-    print("[DEBUG] NearbyPlaces table not found, creating it...")
+    logger.info("NearbyPlaces table not found, creating it...")
     _ = dynamodb_client.load_table("NearbyPlaces")
     _ = dynamodb_client.dynamodb_client.put_item(
-      TableName="NearbyPlaces",
-      Item={
-        "id": {"S": cell.token},
-        "places": {"S": serialize_places(places).decode()},
-      },
+      TableName="NearbyPlaces", Item=item
     )
 
 
 def cache_places(
-  client: Redis, cell: s2helpers.Cell, places: list[Place]
+  client: Redis, cell: s2helpers.Cell, serialized_places: bytes
 ) -> None:
-  _ = client.set(cell.token, serialize_places(places), ex=DEFAULT_CACHE_TTL)
+  _ = client.set(cell.token, serialized_places, ex=DEFAULT_CACHE_TTL)
+
+
+def store_places(
+  client: Redis,
+  dynamodb_client: DynamoDBSetup,
+  cell: s2helpers.Cell,
+  places: list[Place],
+) -> None:
+  """
+  Writes places to both the cache and DynamoDB, serializing them only once
+  """
+  serialized_places = serialize_places(places)
+  cache_places(client, cell, serialized_places)
+  save_places_to_dynamodb(dynamodb_client, cell, serialized_places)
 
 
 def filter_places_for_stream(
@@ -190,19 +213,20 @@ def filter_places_for_stream(
   region: s2helpers.SearchRegion,
   update_stream_callback: Callable[[list[Place]], None],
 ) -> None:
-  filtered_places = listutils.filter(
-    lambda place: s2helpers.haversine_distance(
-      region.latitude,
-      region.longitude,
-      place.latitude,
-      place.longitude,
-    )
-    <= region.radius,
-    places,
+  distance_from_region = s2helpers.haversine_from(
+    region.latitude, region.longitude
   )
+  radius = region.radius
+  # plain comprehension instead of listutils.filter, this runs for every
+  # batch of places so skipping the lambda call per place adds up
+  filtered_places = [
+    place
+    for place in places
+    if distance_from_region(place.latitude, place.longitude) <= radius
+  ]
   # Only send updates if there are places to stream
   if filtered_places:
-    print(f"[DEBUG] Streaming {len(filtered_places)} places to frontend")
+    logger.debug("Streaming %d places to frontend", len(filtered_places))
     update_stream_callback(filtered_places)
 
 
@@ -213,42 +237,37 @@ def calc_dist_from_region_to_nearest_boundary(
   region: s2helpers.SearchRegion, parent: s2helpers.Cell
 ) -> float:
   parent_bounds = s2helpers.get_bounds(parent)
-  dist_from_point_to_top_edge = s2helpers.haversine_distance(
-    region.latitude,
-    region.longitude,
-    parent_bounds.latitude_max,
-    region.longitude,
-  )
-  dist_from_point_to_bottom_edge = s2helpers.haversine_distance(
-    region.latitude,
-    region.longitude,
-    parent_bounds.latitude_min,
-    region.longitude,
+  # Along a meridian the haversine reduces to the arc length, so the
+  # top and bottom edges don't need any trig
+  meters_per_degree = math.radians(s2helpers.EARTH_RADIUS_IN_METERS)
+  dist_from_point_to_top_edge = meters_per_degree * abs(
+    parent_bounds.latitude_max - region.latitude
   )
-  dist_from_point_to_left_edge = s2helpers.haversine_distance(
-    region.latitude,
-    region.longitude,
-    region.latitude,
-    parent_bounds.longitude_min,
-  )
-  dist_from_point_to_right_edge = s2helpers.haversine_distance(
-    region.latitude,
-    region.longitude,
-    region.latitude,
-    parent_bounds.longitude_max,
-  )
-  print(
-    f"[DEBUG] Dist from point to top edge: {dist_from_point_to_top_edge}m"  # noqa: E501
+  dist_from_point_to_bottom_edge = meters_per_degree * abs(
+    region.latitude - parent_bounds.latitude_min
   )
-  print(
-    f"[DEBUG] Dist from point to bottom edge: {dist_from_point_to_bottom_edge}m"  # noqa: E501
+  distance_from_region = s2helpers.haversine_from(
+    region.latitude, region.longitude
   )
-  print(
-    f"[DEBUG] Dist from point to left edge: {dist_from_point_to_left_edge}m"  # noqa: E501
+  dist_from_point_to_left_edge = distance_from_region(
+    region.latitude, parent_bounds.longitude_min
   )
-  print(
-    f"[DEBUG] Dist from point to right edge: {dist_from_point_to_right_edge}m"  # noqa: E501
+  dist_from_point_to_right_edge = distance_from_region(
+    region.latitude, parent_bounds.longitude_max
   )
+  if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(
+      "Dist from point to top edge: %sm", dist_from_point_to_top_edge
+    )
+    logger.debug(
+      "Dist from point to bottom edge: %sm", dist_from_point_to_bottom_edge
+    )
+    logger.debug(
+      "Dist from point to left edge: %sm", dist_from_point_to_left_edge
+    )
+    logger.debug(
+      "Dist from point to right edge: %sm", dist_from_point_to_right_edge
+    )
   dist_from_point_to_nearest_boundary = min(
     dist_from_point_to_top_edge,
     dist_from_point_to_bottom_edge,
@@ -266,53 +285,61 @@ def get_places_in_region(
   should_cancel: Callable[[], bool] | None = None,
   greenlets_container: list[Any] | None = None,
 ) -> list[Place]:
-  print(
-    f"\n[DEBUG] === Getting places for region at ({region.latitude:.6f}, {region.longitude:.6f}) with radius {region.radius}m ==="  # noqa: E501
+  logger.debug(
+    "=== Getting places for region at (%.6f, %.6f) with radius %sm ===",
+    region.latitude,
+    region.longitude,
+    region.radius,
   )
   cell = s2helpers.search_region_to_cell(region)
-  print(f"[DEBUG] Region cell: {cell.token} (level {cell.level})")
+  logger.debug("Region cell: %s (level %d)", cell.token, cell.level)
   parent = s2helpers.get_parent(cell)
-  print(f"[DEBUG] Parent cell: {parent.token} (level {parent.level})")
+  logger.debug("Parent cell: %s (level %d)", parent.token, parent.level)
   # including parent cell only when the region is within the cell
   neighbors = []
   dist_from_point_to_cell_boundary = calc_dist_from_region_to_nearest_boundary(
     region, parent
   )
-  print(
-    f"[DEBUG] Distance to nearest boundary: {dist_from_point_to_cell_boundary:.2f}m"  # noqa: E501
+  logger.debug(
+    "Distance to nearest boundary: %.2fm", dist_from_point_to_cell_boundary
   )
   if dist_from_point_to_cell_boundary <= region.radius:
     neighbors = s2helpers.get_intersecting_cells(region, cell)
 
-    print(
-      f"[DEBUG] Region extends beyond cell boundary - checking {len(neighbors)} cells"  # noqa: E501
+    logger.debug(
+      "Region extends beyond cell boundary - checking %d cells",
+      len(neighbors),
     )
   else:
-    print("[DEBUG] Region stays within parent cell - checking 1 cell")
+    logger.debug("Region stays within parent cell - checking 1 cell")
+
+  # Every place that reaches the stream callback has already been filtered
+  # down to the region, so collect them on the way out instead of running
+  # the distance check over every returned place a second time
+  filtered_places: list[Place] = []
 
-  places_returned: list[Place] = []
+  def collect_and_stream(places: list[Place]) -> None:
+    filtered_places.extend(places)
+    update_stream_callback(places)
+
+  places_returned = 0
   for neighbor in neighbors if neighbors else [parent]:
     neighbor_places = get_places_in_region_loop(
       client,
       dynamodb_client,
       region,
       neighbor,
-      update_stream_callback,
+      collect_and_stream,
       should_cancel,
       greenlets_container,
     )
-    places_returned.extend(neighbor_places)
+    places_returned += len(neighbor_places)
 
-  filtered_places = listutils.filter(
-    lambda place: s2helpers.haversine_distance(
-      region.latitude, region.longitude, place.latitude, place.longitude
-    )
-    <= region.radius,
+  logger.debug(
+    "Total places found: %d (from %d before filtering)",
+    len(filtered_places),
     places_returned,
   )
-  print(
-    f"[DEBUG] Total places found: {len(filtered_places)} (from {len(places_returned)} before filtering)"  # noqa: E501
-  )
   return filtered_places
 
 
@@ -327,7 +354,7 @@ def get_places_in_region_loop(
 ) -> list[Place]:
   # Check if request was cancelled
   if should_cancel and should_cancel():
-    print("[DEBUG] Request cancelled")
+    logger.debug("Request cancelled")
     return []
 
   match cell.level:
@@ -350,25 +377,22 @@ def get_places_in_region_loop(
                 case Ok(places):
                   fetched_places = places
                 case Err(error):
-                  print(
-                    f"[DEBUG] ERROR fetching places for {cell.token}: {error}"
+                  logger.error(
+                    "Error fetching places for %s: %s", cell.token, error
                   )
                   fetched_places = []
               # Only cache non-empty results
               if fetched_places:
-                cache_places(client, cell, fetched_places)
-                save_places_to_dynamodb(dynamodb_client, cell, fetched_places)
+                store_places(client, dynamodb_client, cell, fetched_places)
         # For every child cell we get the places and then we filter them
         # to only include the places that are within the region
         filter_places_for_stream(fetched_places, region, update_stream_callback)
         return fetched_places
       except Exception as e:
         # If lock times out or other error, skip this cell gracefully
-        print(f"[DEBUG] Error acquiring lock for cell {cell.token}: {e}")
+        logger.warning("Error acquiring lock for cell %s: %s", cell.token, e)
         return []
     case level:
-      import eventlet  # pyright: ignore[reportMissingTypeStubs]
-
       parent_places: list[Place] = []
 
       # Use parallel processing for levels 10-13 to speed up large searches
@@ -389,8 +413,8 @@ def get_places_in_region_loop(
               return child_places
             case Err(CacheMiss()):
               match load_places_from_dynamodb(dynamodb_client, child):
-                case Ok(child_places):
-                  cache_places(client, child, child_places)
+                case Ok((child_places, serialized_places)):
+                  cache_places(client, child, serialized_places)
                   filter_places_for_stream(
                     child_places, region, update_stream_callback
                   )
@@ -428,12 +452,12 @@ def get_places_in_region_loop(
               case _:  # pyright: ignore[reportUnknownVariableType]
                 pass
           except Exception as e:
-            print(f"[DEBUG] Greenlet error: {e}")
+            logger.warning("Greenlet error: %s", e)
       else:
         # not using parallel processing for lower levels
         for child in s2helpers.get_children(cell):
           if should_cancel and should_cancel():
-            print("[DEBUG] Request cancelled")
+            logger.debug("Request cancelled")
             return []
           match load_places_from_cache(client, child):
             case Ok(child_places):
@@ -443,9 +467,9 @@ def get_places_in_region_loop(
               )
             case Err(CacheMiss()):
               match load_places_from_dynamodb(dynamodb_client, child):
-                case Ok(child_places):
+                case Ok((child_places, serialized_places)):
                   # cache the child places to avoid fetching from the db again
-                  cache_places(client, child, child_places)
+                  cache_places(client, child, serialized_places)
                   parent_places.extend(child_places)
                   filter_places_for_stream(
                     child_places, region, update_stream_callback
@@ -462,12 +486,11 @@ def get_places_in_region_loop(
                   )
                   parent_places.extend(child_places)
             case Err(CorruptedValue()):
-              print("[DEBUG] Value corrupted")
+              logger.warning("Value corrupted for cell %s", child.token)
               pass
             case _:
               pass
       # Cache the parent places (only if non-empty)
       if parent_places:
-        cache_places(client, cell, parent_places)
-        save_places_to_dynamodb(dynamodb_client, cell, parent_places)
+        store_places(client, dynamodb_client, cell, parent_places)
       return parent_places
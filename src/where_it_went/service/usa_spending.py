@@ -85,18 +85,24 @@ class USASpendingError(Exception):
   pass
 
 
+# Shared by every client so connections to the API are reused across
+# requests instead of doing a new TLS handshake each time
+usa_spending_session = requests.Session()
+
+
 class USASpendingClient:
   """Client for interacting with USA Spending API."""
 
   def __init__(self) -> None:
     self.base_url: str = "https://api.usaspending.gov/api/v2"
-    self.client: requests.Session = requests.Session()
+    self.client: requests.Session = usa_spending_session
 
   def __enter__(self) -> Self:
     return self
 
   def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-    self.client.close()
+    # The session is shared between clients, so it's left open
+    pass
 
   @result.with_unwrap
   def search_spending_by_award(
@@ -1,5 +1,8 @@
-from typing import Any
+from typing import Any, cast
 
+import eventlet  # pyright: ignore[reportMissingTypeStubs]
+from eventlet.queue import LightQueue  # pyright: ignore[reportMissingTypeStubs]
+from flask import request
 from flask_socketio import (
   Namespace,
   emit,  # pyright: ignore[reportUnknownVariableType]
@@ -31,19 +34,26 @@ class SocketSetup(Namespace):
     self.active_requests = {}
     self.active_greenlets = {}
 
+  def kill_greenlets(self, client_id: str) -> None:
+    """
+    Kills the greenlets tracked for the client's previous request
+    """
+    greenlets = self.active_greenlets.pop(client_id, [])
+    if not greenlets:
+      return
+
+    print(f"[SocketSetup] Killing {len(greenlets)} greenlets from old request")
+    for greenlet in greenlets:
+      greenlet.kill()  # type: ignore
+
   def on_connect(self):
     print(f"[SocketSetup] Client connected to namespace {self.namespace}")
 
   def on_disconnect(self):
-    from flask import request
-
     client_id: str = request.sid  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
 
     # Kill any active greenlets for this client
-    if client_id in self.active_greenlets:
-      for greenlet in self.active_greenlets[client_id]:
-        greenlet.kill()  # type: ignore
-      del self.active_greenlets[client_id]
+    self.kill_greenlets(client_id)  # pyright: ignore[reportUnknownArgumentType]
 
     # Clean up request tracking for this client
     if client_id in self.active_requests:
@@ -61,18 +71,11 @@ class SocketSetup(Namespace):
       "radius": float
     }
     """
-    from flask import request
-
     # Get client session ID and increment request counter
     client_id: str = request.sid  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
 
     # Kill old greenlets from previous request
-    if client_id in self.active_greenlets:
-      killed_count = len(self.active_greenlets[client_id])
-      print(f"[SocketSetup] Killing {killed_count} greenlets from old request")
-      for greenlet in self.active_greenlets[client_id]:
-        greenlet.kill()  # type: ignore
-      del self.active_greenlets[client_id]
+    self.kill_greenlets(client_id)  # pyright: ignore[reportUnknownArgumentType]
 
     request_id = self.active_requests.get(client_id, 0) + 1  # pyright: ignore[reportUnknownArgumentType]
     self.active_requests[client_id] = request_id
@@ -95,21 +98,43 @@ class SocketSetup(Namespace):
     def should_cancel() -> bool:
       return self.active_requests.get(client_id) != request_id  # pyright: ignore[reportUnknownArgumentType]
 
-    def stream_update(partial_places: list[Place]):
-      import eventlet  # pyright: ignore[reportMissingTypeStubs]
+    # Partial results are queued up and sent by a single emitter greenlet,
+    # so the search never waits on the socket. None marks the end
+    updates = LightQueue()
 
+    def stream_update(partial_places: list[Place]):
       # Check if this request is still active
-      if should_cancel():
-        return
-
-      # Use self.emit with 'room' parameter to work from greenlets
-      _ = self.emit(  # pyright: ignore[reportUnknownMemberType]
-        "places_update",
-        {"places": [p.model_dump() for p in partial_places]},
-        room=client_id,  # pyright: ignore[reportUnknownArgumentType]
-      )
-      # Delay to prevent Socket.IO from batching multiple emits
-      eventlet.sleep(0.01)  # type: ignore  # pyright: ignore[reportArgumentType]
+      if not should_cancel():
+        updates.put(partial_places)  # pyright: ignore[reportUnknownMemberType]
+
+    def emit_updates():
+      done = False
+      while not done:
+        batch = cast(list[Place] | None, updates.get())  # pyright: ignore[reportUnknownMemberType]
+        if batch is None:
+          return
+        places = list(batch)
+        # Whatever piled up while the last emit went out is merged into
+        # one update, batches never overlap so nothing is dropped
+        while not done and not updates.empty():
+          match cast(list[Place] | None, updates.get_nowait()):
+            case None:
+              done = True
+            case more_places:
+              places.extend(more_places)
+
+        if should_cancel():
+          continue
+        # Use self.emit with 'room' parameter to work from greenlets
+        _ = self.emit(  # pyright: ignore[reportUnknownMemberType]
+          "places_update",
+          # the models are handed straight to the packet encoder, which is
+          # pydantic-core, so no intermediate dicts are built for them
+          {"places": places},
+          room=client_id,  # pyright: ignore[reportUnknownArgumentType]
+        )
+        # Delay to prevent Socket.IO from batching multiple emits
+        eventlet.sleep(0.01)  # type: ignore  # pyright: ignore[reportArgumentType]
 
     try:
       # Check if request is still active before processing
@@ -117,14 +142,22 @@ class SocketSetup(Namespace):
         print(f"[SocketSetup] Request {request_id} cancelled before processing")
         return
 
-      all_places = get_places_in_region(
-        self.redis_client,
-        self.dynamodb_client,
-        region,
-        stream_update,
-        should_cancel,
-        greenlets_container,
-      )
+      emitter = eventlet.spawn(emit_updates)  # pyright: ignore[reportUnknownMemberType]
+      greenlets_container.append(emitter)
+      try:
+        all_places = get_places_in_region(
+          self.redis_client,
+          self.dynamodb_client,
+          region,
+          stream_update,
+          should_cancel,
+          greenlets_container,
+        )
+      finally:
+        # Letting the emitter flush what's left so every update
+        # goes out before the completion event
+        updates.put(None)  # pyright: ignore[reportUnknownMemberType]
+        _ = emitter.wait()  # pyright: ignore[reportUnknownVariableType]
 
       # Store greenlets for this client
       if greenlets_container:
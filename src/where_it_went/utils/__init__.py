@@ -1,4 +1,3 @@
-from functools import reduce
 from typing import Any, Callable, overload
 
 
@@ -102,8 +101,6 @@ def pipe[a, b, c, d, e, f, g, h, i, j](
 
 
 def pipe(value: Any, *funcs: Any):  # pyright: ignore[reportInconsistentOverload]
-  return reduce(
-    lambda val, func: func(val),
-    funcs,
-    value,
-  )
+  for func in funcs:
+    value = func(value)
+  return value
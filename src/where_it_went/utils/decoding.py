@@ -6,11 +6,12 @@ from where_it_went.utils.result import Err, Ok, Result
 
 
 def decode_model[m: BaseModel](model: type[m], json: Any) -> Result[m, str]:
-  match json:
-    case dict(data):  # pyright: ignore[reportUnknownVariableType]
-      try:
-        return Ok(model(**data))
-      except ValidationError as e:
-        return Err(str(e))
-    case _:
-      return Err("Only json objects can be decoded into a pydantic model")
+  if not isinstance(json, dict):
+    return Err("Only json objects can be decoded into a pydantic model")
+
+  try:
+    # model_validate hands the dict to pydantic-core as is,
+    # calling the model with **json would unpack it into kwargs first
+    return Ok(model.model_validate(json))
+  except ValidationError as e:
+    return Err(str(e))
@@ -0,0 +1,20 @@
+from typing import Any
+
+import pydantic_core
+
+
+def dumps(obj: Any, **_kwargs: Any) -> str:
+  """
+  Drop-in for `json.dumps` backed by pydantic-core's serializer
+
+  Formatting options like `separators` are accepted for compatibility
+  but ignored, the output is always compact
+  """
+  return pydantic_core.to_json(obj).decode()
+
+
+def loads(s: str | bytes, **_kwargs: Any) -> Any:
+  """
+  Drop-in for `json.loads` backed by pydantic-core's parser
+  """
+  return pydantic_core.from_json(s)
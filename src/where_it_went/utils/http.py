@@ -1,9 +1,10 @@
+from collections.abc import Mapping
 from http import HTTPMethod, HTTPStatus
 from typing import Any
 
 import flask
+import pydantic_core
 import requests
-from requests.exceptions import JSONDecodeError
 
 from where_it_went.utils.result import Err, Ok, Result
 
@@ -25,15 +26,18 @@ def parse_post_json(request: flask.Request) -> Result[Any, str]:
       return Ok(json)
 
 
-def parse_get_json(request: flask.Request) -> Result[dict[str, str], str]:
+def parse_get_json(request: flask.Request) -> Result[Mapping[str, str], str]:
   """
-  Parses a flask get request's url parameters into a json object
+  Parses a flask get request's url parameters into a read-only mapping
+
+  The request's own args are handed back instead of a copy, for repeated
+  keys only the first value is visible through the mapping
 
   Returns error if request method is not get
   """
   match request.method:
     case HTTPMethod.GET:
-      return Ok(request.args.to_dict())
+      return Ok(request.args)
     case method:
       return Err(f"Invalid Method! Expected: GET, got: {method}")
 
@@ -45,11 +49,15 @@ def parse_response_json(response: requests.Response) -> Result[Any, str]:
   Returns error if status code is not 200 or if body is invalid json
 
   """
-  match HTTPStatus(response.status_code):
-    case HTTPStatus.OK:
-      try:
-        return Ok(response.json())
-      except JSONDecodeError as e:
-        return Err(str(e))
-    case code:
-      return Err(f"Unexpected status code: {code} ({code.phrase})")
+  # Comparing the raw int first, the enum member is only looked up to
+  # describe an error
+  if response.status_code == HTTPStatus.OK:
+    try:
+      # parsing the raw bytes in pydantic-core skips the text decode
+      # and stdlib json that `response.json()` goes through
+      return Ok(pydantic_core.from_json(response.content))
+    except ValueError as e:
+      return Err(str(e))
+
+  code = HTTPStatus(response.status_code)
+  return Err(f"Unexpected status code: {code} ({code.phrase})")
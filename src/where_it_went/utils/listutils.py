@@ -1,11 +1,14 @@
 import builtins
 import functools
 import itertools
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import overload
 
 from where_it_went.utils.result import Err, Ok, Result
 
+# Results are immutable, so every miss in `find` can share the same Err
+_ERR_NONE: Err[None] = Err(None)
+
 
 @overload
 def map[a, b](func: Callable[[a], b], lst: list[a]) -> list[b]: ...
@@ -13,16 +16,14 @@ def map[a, b](func: Callable[[a], b], lst: list[a]) -> list[b]: ...
 def map[a, b](func: Callable[[a], b]) -> Callable[[list[a]], list[b]]: ...
 
 
-def map[a, b](func: Callable[[a], b], lst: list[a] | None = None) -> object:
-  match lst:
-    case None:
+def do_map[a, b](func: Callable[[a], b], lst: list[a]) -> list[b]:
+  return [func(element) for element in lst]
 
-      def apply(lst: list[a]) -> list[b]:
-        return [func(element) for element in lst]
 
-      return apply
-    case lst:
-      return [func(element) for element in lst]
+def map[a, b](func: Callable[[a], b], lst: list[a] | None = None) -> object:
+  if lst is not None:
+    return [func(element) for element in lst]
+  return functools.partial(do_map, func)
 
 
 @overload
@@ -33,16 +34,20 @@ def flatten[a](lst: list[list[a]]) -> list[a]: ...
 def flatten[a]() -> Callable[[list[list[a]]], list[a]]: ...
 
 
-def flatten[a](lst: list[list[a]] | None = None) -> object:
-  match lst:
-    case None:
+def do_flatten[a](lst: list[list[a]]) -> list[a]:
+  # extend copies each sublist in one go, where chain hands over
+  # elements one at a time and keeps regrowing the result
+  flattened: list[a] = []
+  extend = flattened.extend
+  for sublist in lst:
+    extend(sublist)
+  return flattened
 
-      def apply(lst: list[list[a]]) -> list[a]:
-        return list(itertools.chain.from_iterable(lst))
 
-      return apply
-    case lst:
-      return list(itertools.chain.from_iterable(lst))
+def flatten[a](lst: list[list[a]] | None = None) -> object:
+  if lst is not None:
+    return do_flatten(lst)
+  return do_flatten
 
 
 @overload
@@ -57,18 +62,18 @@ def fold[a, acc](
 ) -> Callable[[list[a]], acc]: ...
 
 
+def do_fold[a, acc](
+  func: Callable[[acc, a], acc], initial: acc, lst: list[a]
+) -> acc:
+  return functools.reduce(func, lst, initial)
+
+
 def fold[a, acc](
   func: Callable[[acc, a], acc], initial: acc, lst: list[a] | None = None
 ) -> object:
-  match lst:
-    case None:
-
-      def apply(lst: list[a]) -> acc:
-        return functools.reduce(func, lst, initial)
-
-      return apply
-    case lst:
-      return functools.reduce(func, lst, initial)
+  if lst is not None:
+    return functools.reduce(func, lst, initial)
+  return functools.partial(do_fold, func, initial)
 
 
 def range(start: int, stop: int) -> list[int]:
@@ -85,18 +90,16 @@ def filter[a](
 ) -> Callable[[list[a]], list[a]]: ...
 
 
+def do_filter[a](predicate: Callable[[a], bool], lst: list[a]) -> list[a]:
+  return list(builtins.filter(predicate, lst))
+
+
 def filter[a](
   predicate: Callable[[a], bool], lst: list[a] | None = None
 ) -> object:
-  match lst:
-    case None:
-
-      def apply(lst: list[a]) -> list[a]:
-        return list(builtins.filter(predicate, lst))
-
-      return apply
-    case lst:
-      return list(builtins.filter(predicate, lst))
+  if lst is not None:
+    return list(builtins.filter(predicate, lst))
+  return functools.partial(do_filter, predicate)
 
 
 @overload
@@ -115,28 +118,22 @@ def do_try_map[a, b, e](
   fun: Callable[[a], Result[b, e]], lst: list[a]
 ) -> Result[list[b], e]:
   acc: list[b] = []
+  append = acc.append
   for item in lst:
     res = fun(item)
-    match res:
-      case Ok(value):
-        acc.append(value)
-      case Err(e):
-        return Err(e)
+    if type(res) is not Ok:
+      # the first Err is handed back as is
+      return res
+    append(res.ok_value)
   return Ok(acc)
 
 
 def try_map[a, b, e](
   fun: Callable[[a], Result[b, e]], lst: list[a] | None = None
 ) -> object:
-  match lst:
-    case None:
-
-      def apply(lst: list[a]) -> Result[list[b], e]:
-        return do_try_map(fun, lst)
-
-      return apply
-    case lst:
-      return do_try_map(fun, lst)
+  if lst is not None:
+    return do_try_map(fun, lst)
+  return functools.partial(do_try_map, fun)
 
 
 @overload
@@ -147,42 +144,63 @@ def window_by_2[a](lst: list[a]) -> list[tuple[a, a]]: ...
 def window_by_2[a]() -> Callable[[list[tuple[a, a]]], list[tuple[a, a]]]: ...
 
 
+def do_window_by_2[a](lst: list[a]) -> list[tuple[a, a]]:
+  return list(itertools.pairwise(lst))
+
+
 def window_by_2[a](lst: list[a] | None = None) -> object:
-  match lst:
-    case None:
+  if lst is not None:
+    return list(itertools.pairwise(lst))
+  return do_window_by_2
 
-      def apply(lst: list[a]) -> list[tuple[a, a]]:
-        return list(itertools.pairwise(lst))
 
-      return apply
-    case lst:
-      return list(itertools.pairwise(lst))
+@overload
+def sized_chunk[a](count: int, lst: list[a]) -> list[tuple[a, ...]]: ...
 
 
 @overload
-def sized_chunk[a](count: int, lst: list[a]) -> list[list[a]]: ...
+def sized_chunk[a](count: int) -> Callable[[list[a]], list[tuple[a, ...]]]: ...
+
+
+def do_sized_chunk[a](count: int, lst: list[a]) -> list[tuple[a, ...]]:
+  """
+  Chunks are the tuples `itertools.batched` produces, they aren't copied
+  into lists since nothing mutates them
+  """
+  return list(do_sized_chunk_iter(count, lst))
+
+
+def sized_chunk[a](count: int, lst: list[a] | None = None) -> object:
+  if lst is not None:
+    return do_sized_chunk(count, lst)
+  return functools.partial(do_sized_chunk, count)
 
 
 @overload
-def sized_chunk[a](count: int) -> Callable[[list[a]], list[list[a]]]: ...
+def sized_chunk_iter[a](
+  count: int, lst: list[a]
+) -> Iterator[tuple[a, ...]]: ...
 
 
-def do_sized_chunk[a](count: int, lst: list[a]) -> list[list[a]]:
-  count = 1 if count < 1 else count
+@overload
+def sized_chunk_iter[a](
+  count: int,
+) -> Callable[[list[a]], Iterator[tuple[a, ...]]]: ...
 
-  return [list(chunk) for chunk in itertools.batched(lst, count)]
 
+def do_sized_chunk_iter[a](count: int, lst: list[a]) -> Iterator[tuple[a, ...]]:
+  count = 1 if count < 1 else count
 
-def sized_chunk[a](count: int, lst: list[a] | None = None) -> object:
-  match lst:
-    case None:
+  return itertools.batched(lst, count)
 
-      def apply(lst: list[a]) -> list[list[a]]:
-        return do_sized_chunk(count, lst)
 
-      return apply
-    case lst:
-      return do_sized_chunk(count, lst)
+def sized_chunk_iter[a](count: int, lst: list[a] | None = None) -> object:
+  """
+  Lazy version of `sized_chunk` for stages that only go over the chunks once
+  """
+  if lst is not None:
+    return do_sized_chunk_iter(count, lst)
+  return functools.partial(do_sized_chunk_iter, count)
 
 
 @overload
@@ -198,24 +216,14 @@ def group[k, v](
 def do_group[k, v](to_key: Callable[[v], k], lst: list[v]) -> dict[k, list[v]]:
   groups: dict[k, list[v]] = {}
   for element in lst:
-    key = to_key(element)
-    if key in groups:
-      groups[key].append(element)
-    else:
-      groups[key] = [element]
+    groups.setdefault(to_key(element), []).append(element)
   return groups
 
 
 def group[k, v](to_key: Callable[[v], k], lst: list[v] | None = None) -> object:
-  match lst:
-    case None:
-
-      def apply(lst: list[v]) -> dict[k, list[v]]:
-        return do_group(to_key, lst)
-
-      return apply
-    case lst:
-      return do_group(to_key, lst)
+  if lst is not None:
+    return do_group(to_key, lst)
+  return functools.partial(do_group, to_key)
 
 
 @overload
@@ -228,22 +236,23 @@ def argmax[a, b: int | float](
 ) -> Callable[[list[a]], a]: ...
 
 
+def do_argmax[a, b: int | float](func: Callable[[a], b], lst: list[a]) -> a:
+  return max(lst, key=func)
+
+
 def argmax[a, b: int | float](
   func: Callable[[a], b], lst: list[a] | None = None
 ) -> object:
   """
   Applies the given function to every element in the list and returns
   the element that produced the highest value
-  """
-  match lst:
-    case None:
 
-      def apply(lst: list[a]) -> a:
-        return max(lst, key=func)
-
-      return apply
-    case lst:
-      return max(lst, key=func)
+  `max` already calls `func` exactly once per element and keeps the best
+  key around, so there's nothing to gain from precomputing the keys
+  """
+  if lst is not None:
+    return max(lst, key=func)
+  return functools.partial(do_argmax, func)
 
 
 @overload
@@ -262,25 +271,15 @@ def do_find[a](
   is_desired: Callable[[a], bool], lst: list[a]
 ) -> Result[a, None]:
   for element in lst:
-    match is_desired(element):
-      case True:
-        return Ok(element)
-      case False:
-        pass
+    if is_desired(element):
+      return Ok(element)
 
-  return Err(None)
+  return _ERR_NONE
 
 
 def find[a](
   is_desired: Callable[[a], bool], lst: list[a] | None = None
 ) -> object:
-  match lst:
-    case None:
-
-      def apply(lst: list[a]) -> Result[a, None]:
-        return do_find(is_desired, lst)
-
-      return apply
-
-    case lst:
-      return do_find(is_desired, lst)
+  if lst is not None:
+    return do_find(is_desired, lst)
+  return functools.partial(do_find, is_desired)
@@ -14,13 +14,14 @@ class Ok[T]:
   """
 
   __match_args__ = ("ok_value",)
-  __slots__ = ("_value",)
+  __slots__ = ("_value", "_hash")
 
   def __iter__(self) -> Iterator[T]:
     yield self._value
 
   def __init__(self, value: T) -> None:
     self._value = value
+    self._hash: int | None = None
 
   @override
   def __repr__(self) -> str:
@@ -28,7 +29,9 @@ class Ok[T]:
 
   @override
   def __eq__(self, other: Any) -> bool:
-    return isinstance(other, Ok) and self._value == other._value
+    return other is self or (
+      isinstance(other, Ok) and self._value == other._value
+    )
 
   @override
   def __ne__(self, other: Any) -> bool:
@@ -36,7 +39,11 @@ class Ok[T]:
 
   @override
   def __hash__(self) -> int:
-    return hash((True, self._value))
+    # payloads are never reassigned, so the hash only needs computing once
+    h = self._hash
+    if h is None:
+      h = self._hash = hash((True, self._value))
+    return h
 
   @property
   def ok_value(self) -> T:
@@ -66,7 +73,7 @@ class Err[E]:
   """
 
   __match_args__ = ("err_value",)
-  __slots__ = ("_value",)
+  __slots__ = ("_value", "_hash")
 
   def __iter__(self) -> Iterator[NoReturn]:
     def _iter() -> Iterator[NoReturn]:
@@ -80,6 +87,7 @@ class Err[E]:
 
   def __init__(self, value: E) -> None:
     self._value = value
+    self._hash: int | None = None
 
   @override
   def __repr__(self) -> str:
@@ -87,7 +95,9 @@ class Err[E]:
 
   @override
   def __eq__(self, other: Any) -> bool:
-    return isinstance(other, Err) and self._value == other._value
+    return other is self or (
+      isinstance(other, Err) and self._value == other._value
+    )
 
   @override
   def __ne__(self, other: Any) -> bool:
@@ -95,7 +105,10 @@ class Err[E]:
 
   @override
   def __hash__(self) -> int:
-    return hash((False, self._value))
+    h = self._hash
+    if h is None:
+      h = self._hash = hash((False, self._value))
+    return h
 
   @property
   def err_value(self) -> E:
@@ -0,0 +1,14 @@
+from collections.abc import Generator
+
+import pytest
+
+from where_it_went.service.usa_spending import USASpendingClient
+
+
+@pytest.fixture(scope="session")
+def usa_client() -> Generator[USASpendingClient, None, None]:
+  """
+  One USA Spending client shared by every test in the session
+  """
+  with USASpendingClient() as client:
+    yield client
@@ -1,7 +1,9 @@
 import os
+import random
 
 import fakeredis
 import pytest
+import s2cell  # pyright: ignore[reportMissingTypeStubs]
 from flask_socketio import SocketIOTestClient
 
 from where_it_went.app import app, socketio
@@ -239,6 +241,77 @@ def print_distances_test() -> None:
   assert True
 
 
+def search_region_to_cell_contains_point_test() -> None:
+  """The cell for a region should always contain the cell's own point"""
+  rng = random.Random(0)
+  for _ in range(5000):
+    region = s2helpers.SearchRegion(
+      latitude=rng.uniform(-89.9, 89.9),
+      longitude=rng.uniform(-179.9, 179.9),
+      radius=rng.choice([50.0, 200.0, 1000.0, 5000.0]),
+    )
+    cell = s2helpers.search_region_to_cell(region)
+    assert cell.point is not None
+    latitude, longitude = cell.point
+    cell_id = s2cell.lat_lon_to_cell_id(latitude, longitude, level=cell.level)
+    assert cell_id == cell.id
+
+
+def search_region_bounds_over_pole_test() -> None:
+  """A region reaching over a pole spans every longitude"""
+  region = s2helpers.SearchRegion(latitude=89.99, longitude=0.0, radius=5000.0)
+  bounds = region.bounds
+  assert bounds.longitude_min == -180.0
+  assert bounds.longitude_max == 180.0
+  assert bounds.latitude_max > 90.0
+
+  # ~2.2km away, on the opposite side of the pole
+  cell = s2helpers.search_region_to_cell(
+    s2helpers.SearchRegion(latitude=89.99, longitude=180.0, radius=5000.0)
+  )
+  assert s2helpers.search_region_intersects_cell(region, cell)
+
+
+def search_region_intersects_cell_across_antimeridian_test() -> None:
+  """Cells just across ±180° are still found when within the radius"""
+  region = s2helpers.SearchRegion(
+    latitude=0.0, longitude=179.999, radius=1000.0
+  )
+  assert region.bounds.longitude_max > 180.0
+
+  # ~220m away, but numerically on the other end of the longitude range
+  cell = s2helpers.search_region_to_cell(
+    s2helpers.SearchRegion(latitude=0.0, longitude=-179.999, radius=1000.0)
+  )
+  assert s2helpers.search_region_intersects_cell(region, cell)
+
+
+def search_region_intersects_cell_rejects_far_neighbor_test() -> None:
+  """Cells outside of the region's bounding box never reach the haversine"""
+  region = s2helpers.SearchRegion(
+    latitude=38.83158313707954, longitude=-77.31166127240445, radius=100.0
+  )
+  far_cells = [
+    s2helpers.search_region_to_cell(
+      s2helpers.SearchRegion(
+        latitude=latitude, longitude=longitude, radius=100.0
+      )
+    )
+    for latitude, longitude in [
+      (38.84158313707954, -77.31166127240445),  # ~1.1km north
+      (38.83158313707954, -77.29166127240445),  # ~1.7km east
+    ]
+  ]
+
+  def distance_from_region(latitude: float, longitude: float) -> float:
+    raise AssertionError(f"haversine called for ({latitude}, {longitude})")
+
+  for cell in far_cells:
+    assert not s2helpers.search_region_intersects_cell(
+      region, cell, distance_from_region
+    )
+
+
 if __name__ == "__main__":
   gmu_caching_two_requests_test()
   print_distances_test()
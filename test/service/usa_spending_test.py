@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
 """Comprehensive test suite for USA Spending API service."""
 
-import sys
-from pathlib import Path
+import json
+from http import HTTPStatus
 from typing import Any
 
 import pytest
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import requests
+from pydantic import TypeAdapter
 
 from where_it_went.service.usa_spending import (
   Award,
@@ -17,11 +16,118 @@ from where_it_went.service.usa_spending import (
   SpendingRequest,
   SpendingResponse,
   USASpendingClient,
+  usa_spending_session,
 )
 from where_it_went.utils.result import Err, Ok
 
 # Using pytest test functions
 
+# Locations shared by the tests below, they're never mutated so building
+# and validating them once for the whole module is enough
+_LOC_22030 = PlaceOfPerformance(country="USA", state="VA", zip="22030")
+_LOC_22150 = PlaceOfPerformance(country="USA", state="VA", zip="22150")
+_DEFAULT_LOCATIONS = [_LOC_22030]
+_GMU_LOCATIONS = [_LOC_22030, _LOC_22150]
+
+# Every field of an award, keyed by the aliases the API uses
+_AWARD_DATA: dict[str, Any] = {
+  "Award ID": "12345",
+  "Recipient Name": "Test University",
+  "Award Amount": 100000.0,
+  "Awarding Agency": "Test Agency",
+  "Start Date": "2023-01-01",
+  "End Date": "2023-12-31",
+  "Place of Performance Zip5": "22030",
+  "Description": "Test award",
+}
+_TEST_AWARD = Award(**_AWARD_DATA)
+
+# Tests that only read an award back share this one instead of validating
+# their own, model_construct is no faster than that on pydantic 2.14
+_SAMPLE_AWARD_DATA: dict[str, Any] = {
+  "Award ID": "123",
+  "Recipient Name": "Test",
+  "Award Amount": 1000.0,
+}
+_SAMPLE_AWARD = Award(**_SAMPLE_AWARD_DATA)
+
+_REQUEST_ADAPTER = TypeAdapter(SpendingRequest)
+
+# Read-only, pydantic turns it into the list the model expects
+_DEFAULT_FIELDS: tuple[str, ...] = (
+  "Award ID",
+  "Recipient Name",
+  "Award Amount",
+  "Awarding Agency",
+  "Start Date",
+  "End Date",
+  "Place of Performance Zip5",
+  "Description",
+)
+
+# A request with every field left at its default, dumped once since
+# nothing about it changes between tests
+_DEFAULT_REQUEST = SpendingRequest(filters=SpendingFilters())
+_DEFAULT_REQUEST_DUMP = _DEFAULT_REQUEST.model_dump(by_alias=True)
+
+# Sample response in the shape the live spending_by_award endpoint returns
+# for the George Mason search below, extra keys included
+SPENDING_BY_AWARD_RESPONSE: dict[str, Any] = {
+  "limit": 10,
+  "results": [
+    {
+      "internal_id": 171512489,
+      "Award ID": "HR001121C0192",
+      "Recipient Name": "GEORGE MASON UNIVERSITY",
+      "Award Amount": 7474658.0,
+      "Awarding Agency": "Department of Defense",
+      "Start Date": "2021-09-15",
+      "End Date": "2025-09-30",
+      "Place of Performance Zip5": "22030",
+      "Description": "MICROSYSTEMS TECHNOLOGY OFFICE RESEARCH",
+      "generated_internal_id": "CONT_AWD_HR001121C0192_9700_-NONE-_-NONE-",
+    },
+    {
+      "internal_id": 68783525,
+      "Award ID": "N0001419C1035",
+      "Recipient Name": "GEORGE MASON UNIVERSITY",
+      "Award Amount": 1299978.0,
+      "Awarding Agency": "Department of Defense",
+      "Start Date": "2019-07-01",
+      "End Date": "2023-06-30",
+      "Place of Performance Zip5": "22030",
+      "Description": "ADAPTIVE AUTONOMY RESEARCH",
+      "generated_internal_id": "CONT_AWD_N0001419C1035_9700_-NONE-_-NONE-",
+    },
+  ],
+  "page_metadata": {"page": 1, "hasNext": False, "last_record_unique_id": None},
+  "messages": [],
+}
+
+
+@pytest.fixture
+def mock_usa_spending(
+  monkeypatch: pytest.MonkeyPatch,
+) -> list[dict[str, Any]]:
+  """
+  Serves the recorded spending_by_award response instead of calling the API
+
+  Returns the list that request bodies sent by the client are appended to
+  """
+  posted: list[dict[str, Any]] = []
+  content = json.dumps(SPENDING_BY_AWARD_RESPONSE).encode()
+
+  def post(url: str, json: dict[str, Any], **_kwargs: Any) -> requests.Response:
+    assert url == "https://api.usaspending.gov/api/v2/search/spending_by_award/"
+    posted.append(json)
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response._content = content
+    return response
+
+  monkeypatch.setattr(usa_spending_session, "post", post)
+  return posted
+
 
 def place_of_performance_model_test() -> None:
   """Test PlaceOfPerformance model creation and validation."""
@@ -42,7 +148,7 @@ def place_of_performance_model_test() -> None:
   print("✅ Model creation and serialization works")
 
 
-def test_spending_filters_model() -> None:
+def spending_filters_model_test() -> None:
   """Test SpendingFilters model creation and defaults."""
   print("🧪 Testing SpendingFilters model...")
 
@@ -53,11 +159,10 @@ def test_spending_filters_model() -> None:
   assert filters.place_of_performance_locations == []
 
   # Test with custom values
-  locations = [PlaceOfPerformance(country="USA", state="VA", zip="22030")]
   filters = SpendingFilters(
     award_type_codes=["A", "B"],
     recipient_search_text=["Test University"],
-    place_of_performance_locations=locations,
+    place_of_performance_locations=_DEFAULT_LOCATIONS,
   )
   assert len(filters.award_type_codes) == 2
   assert len(filters.recipient_search_text) == 1
@@ -70,8 +175,7 @@ def spending_request_model_test() -> None:
   """Test SpendingRequest model creation and defaults."""
   print("🧪 Testing SpendingRequest model...")
 
-  filters = SpendingFilters()
-  request = SpendingRequest(filters=filters)
+  request = _DEFAULT_REQUEST
 
   # Test defaults
   assert request.limit == 10
@@ -82,7 +186,7 @@ def spending_request_model_test() -> None:
   assert len(request.fields) == 8  # Default fields
 
   # Test model_dump with by_alias
-  data = request.model_dump(by_alias=True)
+  data = _DEFAULT_REQUEST_DUMP
   assert "filters" in data
   assert "limit" in data
   assert "page" in data
@@ -95,26 +199,18 @@ def award_model_test() -> None:
   print("🧪 Testing Award model...")
 
   # Test creation with aliases
-  award_data: dict[str, Any] = {
-    "Award ID": "12345",
-    "Recipient Name": "Test University",
-    "Award Amount": 100000.0,
-    "Awarding Agency": "Test Agency",
-    "Start Date": "2023-01-01",
-    "End Date": "2023-12-31",
-    "Place of Performance Zip5": "22030",
-    "Description": "Test award",
-  }
-
-  award = Award(**award_data)
+  award = _TEST_AWARD
   assert award.award_id == "12345"
   assert award.recipient_name == "Test University"
   assert award.award_amount == 100000.0
 
+  # Test the aliases straight off the schema, no model needed for that
+  aliases = {field.alias for field in Award.model_fields.values()}
+  assert aliases >= {"Award ID", "Recipient Name"}
+
   # Test model_dump with aliases
   data = award.model_dump(by_alias=True)
-  assert data["Award ID"] == "12345"
-  assert data["Recipient Name"] == "Test University"
+  assert data == _AWARD_DATA
 
   print("✅ Award model with aliases works")
 
@@ -123,21 +219,18 @@ def spending_response_model_test() -> None:
   """Test SpendingResponse model."""
   print("🧪 Testing SpendingResponse model...")
 
-  award_data: dict[str, Any] = {
-    "Award ID": "123",
-    "Recipient Name": "Test",
-    "Award Amount": 1000.0,
-  }
-  awards = [Award(**award_data)]
+  awards = [_SAMPLE_AWARD]
   response = SpendingResponse(
     results=awards,
     page_metadata={"total": 1, "page": 1},
     messages=["Test message"],
   )
 
-  assert len(response.results) == 1
-  assert response.page_metadata["total"] == 1
-  assert len(response.messages) == 1
+  assert (response.results, response.page_metadata, response.messages) == (
+    awards,
+    {"total": 1, "page": 1},
+    ["Test message"],
+  )
 
   print("✅ Response model works correctly")
 
@@ -158,117 +251,169 @@ def client_initialization_test() -> None:
   print("✅ Client initialization and context manager work")
 
 
-def create_location_search_test() -> None:
+_ALL_AWARD_TYPES = ["A", "B", "C", "D"]
+
+
+@pytest.mark.parametrize(
+  (
+    "kwargs",
+    "expected_limit",
+    "expected_page",
+    "expected_award_types",
+    "expected_recipients",
+    "expected_location_count",
+  ),
+  [
+    pytest.param({}, 10, 1, _ALL_AWARD_TYPES, [], 0, id="defaults"),
+    pytest.param(
+      {"recipient_search": "Test University"},
+      10,
+      1,
+      _ALL_AWARD_TYPES,
+      ["Test University"],
+      0,
+      id="recipient",
+    ),
+    pytest.param(
+      {"locations": _DEFAULT_LOCATIONS},
+      10,
+      1,
+      _ALL_AWARD_TYPES,
+      [],
+      1,
+      id="locations",
+    ),
+    pytest.param(
+      {"award_types": ["A", "B"]}, 10, 1, ["A", "B"], [], 0, id="award_types"
+    ),
+    pytest.param(
+      {"limit": 5, "page": 2},
+      5,
+      2,
+      _ALL_AWARD_TYPES,
+      [],
+      0,
+      id="limit_and_page",
+    ),
+  ],
+)
+def create_location_search_test(
+  usa_client: USASpendingClient,
+  kwargs: dict[str, Any],
+  expected_limit: int,
+  expected_page: int,
+  expected_award_types: list[str],
+  expected_recipients: list[str],
+  expected_location_count: int,
+) -> None:
   """Test create_location_search method."""
-  print("🧪 Testing create_location_search method...")
-
-  with USASpendingClient() as client:
-    # Test with no parameters (defaults)
-    request = client.create_location_search()
-    assert request.limit == 10
-    assert request.page == 1
-    assert len(request.filters.award_type_codes) == 4
-
-    # Test with recipient search
-    request = client.create_location_search(recipient_search="Test University")
-    assert request.filters.recipient_search_text == ["Test University"]
+  request = usa_client.create_location_search(**kwargs)
+  assert request.limit == expected_limit
+  assert request.page == expected_page
+  assert request.filters.award_type_codes == expected_award_types
+  assert request.filters.recipient_search_text == expected_recipients
+  assert (
+    len(request.filters.place_of_performance_locations)
+    == expected_location_count
+  )
 
-    # Test with locations
-    locations = [PlaceOfPerformance(country="USA", state="VA", zip="22030")]
-    request = client.create_location_search(locations=locations)
-    assert len(request.filters.place_of_performance_locations) == 1
 
-    # Test with award types
-    request = client.create_location_search(award_types=["A", "B"])
-    assert request.filters.award_type_codes == ["A", "B"]
+@pytest.mark.parametrize(
+  ("kwargs", "expected_award_types", "expected_location_count"),
+  [
+    pytest.param({}, _ALL_AWARD_TYPES, 0, id="recipient"),
+    pytest.param(
+      {"locations": _DEFAULT_LOCATIONS}, _ALL_AWARD_TYPES, 1, id="locations"
+    ),
+    pytest.param({"award_types": ["A"]}, ["A"], 0, id="award_types"),
+  ],
+)
+def create_recipient_search_test(
+  usa_client: USASpendingClient,
+  kwargs: dict[str, Any],
+  expected_award_types: list[str],
+  expected_location_count: int,
+) -> None:
+  """Test create_recipient_search method."""
+  request = usa_client.create_recipient_search("Test University", **kwargs)
+  assert request.filters.recipient_search_text == ["Test University"]
+  assert request.filters.award_type_codes == expected_award_types
+  assert (
+    len(request.filters.place_of_performance_locations)
+    == expected_location_count
+  )
 
-    # Test with custom limit and page
-    request = client.create_location_search(limit=5, page=2)
-    assert request.limit == 5
-    assert request.page == 2
 
-  print("✅ create_location_search method works correctly")
+def george_mason_request() -> SpendingRequest:
+  """Builds the exact same request as the PowerShell script."""
+  # The whole request, filters included, is validated in one go
+  return _REQUEST_ADAPTER.validate_python(
+    {
+      "filters": {
+        "award_type_codes": ["A", "B", "C", "D"],
+        "recipient_search_text": ["George Mason University"],
+        "place_of_performance_locations": _GMU_LOCATIONS,
+      },
+      "fields": _DEFAULT_FIELDS,
+      "limit": 10,
+      "page": 1,
+      "subawards": False,
+      "sort": "Award Amount",
+      "order": "desc",
+    }
+  )
 
 
-def create_recipient_search_test() -> None:
-  """Test create_recipient_search method."""
-  print("🧪 Testing create_recipient_search method...")
+def spending_by_award_api_test(
+  usa_client: USASpendingClient, mock_usa_spending: list[dict[str, Any]]
+) -> None:
+  """Test the George Mason search against the recorded API response."""
+  print("🧪 Testing PowerShell-equivalent George Mason search...")
 
-  with USASpendingClient() as client:
-    # Test basic recipient search
-    request = client.create_recipient_search("Test University")
-    assert request.filters.recipient_search_text == ["Test University"]
+  request = george_mason_request()
 
-    # Test with locations
-    locations = [PlaceOfPerformance(country="USA", state="VA", zip="22030")]
-    request = client.create_recipient_search(
-      "Test University", locations=locations
-    )
-    assert request.filters.recipient_search_text == ["Test University"]
-    assert len(request.filters.place_of_performance_locations) == 1
+  result = usa_client.search_spending_by_award(request)
 
-    # Test with award types
-    request = client.create_recipient_search(
-      "Test University", award_types=["A"]
-    )
-    assert request.filters.award_type_codes == ["A"]
+  match result:
+    case Ok(spending_response):
+      assert [award.award_id for award in spending_response.results] == [
+        "HR001121C0192",
+        "N0001419C1035",
+      ]
+      assert spending_response.results[0].award_amount == 7474658.0
+      assert spending_response.page_metadata["page"] == 1
+    case Err(error):
+      pytest.fail(f"API call failed: {error}")
 
-  print("✅ create_recipient_search method works correctly")
+  # The client sends the request as the API expects it
+  assert mock_usa_spending == [
+    request.model_dump(by_alias=True, exclude_none=True)
+  ]
+  print("✅ API call decoded the recorded response")
 
 
-def spending_by_award_api_test() -> None:
+@pytest.mark.network
+def spending_by_award_live_api_test(usa_client: USASpendingClient) -> None:
   """Test the exact same request as the PowerShell script."""
   print("🧪 Testing PowerShell-equivalent George Mason search...")
 
-  # Example location for testing
-  locations = [
-    PlaceOfPerformance(country="USA", state="VA", zip="22030"),
-    PlaceOfPerformance(country="USA", state="VA", zip="22150"),
-  ]
-
-  # Create the filters
-  filters = SpendingFilters(
-    award_type_codes=["A", "B", "C", "D"],
-    recipient_search_text=["George Mason University"],
-    place_of_performance_locations=locations,
-  )
-
-  # Create the full request
-  request = SpendingRequest(
-    filters=filters,
-    fields=[
-      "Award ID",
-      "Recipient Name",
-      "Award Amount",
-      "Awarding Agency",
-      "Start Date",
-      "End Date",
-      "Place of Performance Zip5",
-      "Description",
-    ],
-    limit=10,
-    page=1,
-    subawards=False,
-    sort="Award Amount",
-    order="desc",
-  )
-
   # Make the API call
-  with USASpendingClient() as client:
-    result = client.search_spending_by_award(request)
-
-    match result:
-      case Ok(spending_response):
-        assert len(spending_response.results) > 0
-        print(
-          f"✅ API call succeeded with {len(spending_response.results)} results"
-        )
-        for award in spending_response.results:
-          print(
-            (
-              f"- {award.recipient_name} received ${award.award_amount} "
-              f"for award ID {award.award_id}"
-            )
+  result = usa_client.search_spending_by_award(george_mason_request())
+
+  match result:
+    case Ok(spending_response):
+      assert len(spending_response.results) > 0
+      # Building the whole summary first so it goes out in a single write
+      lines = [
+        f"✅ API call succeeded with {len(spending_response.results)} results",
+        *(
+          (
+            f"- {award.recipient_name} received ${award.award_amount} "
+            f"for award ID {award.award_id}"
           )
-      case Err(error):
-        pytest.fail(f"API call failed: {error}")
+          for award in spending_response.results
+        ),
+      ]
+      print("\n".join(lines))
+    case Err(error):
+      pytest.fail(f"API call failed: {error}")